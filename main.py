@@ -2,10 +2,13 @@
 Stride Fees API - FastAPI application for calculating Stride protocol fees
 """
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from stride_client import StrideClient
@@ -25,7 +28,7 @@ stride_client: StrideClient = None
 
 
 class FeeResponse(BaseModel):
-    """Response model for fee endpoints"""
+    """Response model for fee endpoints (used for the OpenAPI schema)"""
     fees: dict
 
 
@@ -35,14 +38,26 @@ async def lifespan(app: FastAPI):
     global stride_client
 
     # Startup
+    # Endpoints are all async; raise the threadpool limit (default 40) so any sync
+    # code that does end up running in a worker thread can't serialize the app
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
     stride_api_url = os.getenv("STRIDE_API_URL", "https://stride-api.polkachu.com")
     stride_rpc_url = os.getenv("STRIDE_RPC_URL", "https://stride-rpc.polkachu.com")
     price_api_url = os.getenv("PRICE_API_URL", "https://api.coingecko.com/api/v3")
+    price_cache_path = os.getenv("PRICE_CACHE_PATH", "/tmp/price_cache.json")
+    redis_url = os.getenv("REDIS_URL")
+    stride_concurrency = int(os.getenv("STRIDE_MAX_CONCURRENCY", "8"))
+    price_concurrency = int(os.getenv("PRICE_MAX_CONCURRENCY", "2"))
 
     stride_client = StrideClient(
         api_url=stride_api_url,
         rpc_url=stride_rpc_url,
-        price_api_url=price_api_url
+        price_api_url=price_api_url,
+        price_cache_path=price_cache_path,
+        redis_url=redis_url,
+        stride_concurrency=stride_concurrency,
+        price_concurrency=price_concurrency
     )
     logger.info("Stride client initialized")
 
@@ -58,9 +73,13 @@ app = FastAPI(
     title="Stride Fees API",
     description="API for calculating Stride protocol fees for DefiLlama",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Compress larger responses (e.g. /api/all/stats/fees) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 @app.get("/")
 async def root():
@@ -76,7 +95,7 @@ async def root():
 async def get_all_fees():
     """
     Get fees for all supported chains
-    Uses batch price fetching to minimize API calls
+    Uses a single host zone request and a single batch price request
 
     Returns:
         Dictionary with fees for each chain
@@ -88,16 +107,30 @@ async def get_all_fees():
             "umee", "comdex", "haqq", "band"
         ]
 
-        # Pre-fetch all prices in a single batch request to avoid rate limits
-        logger.info("Pre-fetching prices for all chains in batch...")
-        await stride_client.get_token_prices_batch(supported_chains)
+        # Serve from the fee cache when every chain is still fresh
+        cached = {chain: stride_client.get_cached_fee(chain) for chain in supported_chains}
+        if all(cached.values()):
+            return {"chains": cached}
 
+        # Fetch all host zones and all prices concurrently, one request each
+        logger.info("Fetching host zones and prices for all chains in batch...")
+        host_zones, prices = await asyncio.gather(
+            stride_client.get_host_zones(),
+            stride_client.get_token_prices_batch(supported_chains)
+        )
+        zones_by_id = stride_client._index_host_zones(host_zones)
+
+        # Everything is fetched; compute fees per chain without further I/O
         results = {}
         for chain in supported_chains:
             try:
-                # Now calculate fees (prices will come from cache)
-                fees_data = await stride_client.calculate_daily_fee(chain)
-                results[chain] = fees_data
+                chain_id = stride_client.CHAIN_ID_MAP.get(chain)
+                host_zone = zones_by_id.get(chain_id)
+                if not host_zone:
+                    raise ValueError(f"Host zone not found for {chain_id}")
+                token_price = prices.get(chain)
+                results[chain] = stride_client.compute_fee(chain, host_zone, token_price)
+                stride_client.cache_fee(chain, results[chain], token_price)
             except Exception as e:
                 logger.warning(f"Failed to get fees for {chain}: {e}")
                 results[chain] = {
@@ -113,8 +146,8 @@ async def get_all_fees():
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.get("/api/{chain}/stats/fees")
-async def get_chain_fees(chain: str) -> FeeResponse:
+@app.get("/api/{chain}/stats/fees", response_model=FeeResponse)
+async def get_chain_fees(chain: str):
     """
     Get daily fees and revenue for a specific chain
 
@@ -135,7 +168,8 @@ async def get_chain_fees(chain: str) -> FeeResponse:
         # Calculate fees
         fees_data = await stride_client.calculate_daily_fee(chain)
 
-        return FeeResponse(fees=fees_data)
+        # Return the response directly; the dict is built by us, so skip model validation
+        return ORJSONResponse({"fees": fees_data})
 
     except ValueError as e:
         logger.error(f"Invalid chain: {chain} - {e}")
@@ -158,7 +192,7 @@ async def health_check():
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -176,10 +210,16 @@ if __name__ == "__main__":
     # Disable reload in production (Railway, Docker, etc.)
     is_production = os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("DOCKER_CONTAINER")
 
+    # Use one worker per CPU in production (reload and workers are mutually exclusive)
+    # Workers share prices through Redis when REDIS_URL is set, else seed from the on-disk cache
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)) if is_production else 1
+
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
         reload=not is_production,
+        workers=workers,
+        loop="auto",  # uvloop when installed (not available on Windows), else asyncio
         log_level="info"
     )
@@ -1,10 +1,18 @@
 """
 Client for querying Stride blockchain data
+
+All I/O here must stay async (httpx.AsyncClient, redis.asyncio, aiofiles).
+Do not use blocking libraries such as `requests` - a blocking call stalls
+the event loop and every in-flight request with it.
 """
 import httpx
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import os
+import time
+import aiofiles
+import orjson
+import redis.asyncio as redis
+from typing import Dict, List, Optional, Tuple
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -70,40 +78,126 @@ class StrideClient:
         "band": 6,        # uband
     }
 
-    def __init__(self, api_url: str, rpc_url: str, price_api_url: str = "https://api.coingecko.com/api/v3"):
+    # Longest Retry-After we'll wait inside a request before giving up on the fetch
+    MAX_RETRY_DELAY_S = 10.0
+
+    # Precomputed 10 ** decimals per chain, so the fee path doesn't recompute it per request
+    TOKEN_DIVISORS = {chain: 10 ** decimals for chain, decimals in TOKEN_DECIMALS.items()}
+
+    def __init__(
+        self,
+        api_url: str,
+        rpc_url: str,
+        price_api_url: str = "https://api.coingecko.com/api/v3",
+        price_cache_path: Optional[str] = "/tmp/price_cache.json",
+        redis_url: Optional[str] = None,
+        stride_concurrency: int = 8,
+        price_concurrency: int = 2
+    ):
         self.api_url = api_url.rstrip("/")
         self.rpc_url = rpc_url.rstrip("/")
         self.price_api_url = price_api_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,  # Multiplex concurrent requests over a single TLS connection
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            )
+        )
+
+        # Bound concurrent outbound requests per upstream to stay under rate limits
+        self._stride_sem = asyncio.Semaphore(stride_concurrency)
+        self._price_sem = asyncio.Semaphore(price_concurrency)
+
+        # Host zone responses keyed by URL, revalidated with conditional GETs
+        self._zone_cache: Dict[str, Tuple[Optional[str], Optional[str], Dict]] = {}  # {url: (etag, last_modified, body)}
+
+        # Computed fee caching
+        self._fee_cache: Dict[str, Tuple[float, Dict]] = {}  # {chain: (expires_at monotonic seconds, fees)}
+        self._fee_cache_duration_s = 60.0  # Redemption rates only change per epoch
+        self._fee_stale_duration_s = 600.0  # Serve stale fees while recomputing for up to 10 minutes
+        self._fee_tasks: Dict[str, asyncio.Task] = {}  # In-progress fee computations, shared by callers
 
         # Price caching
-        self._price_cache: Dict[str, Dict] = {}  # {chain: {"price": float, "timestamp": datetime}}
-        self._cache_duration = timedelta(minutes=5)  # Cache prices for 5 minutes
-        self._price_fetch_lock = asyncio.Lock()  # Prevent concurrent fetches
+        self._price: Dict[str, float] = {}  # {chain: price}
+        self._price_expiry: Dict[str, float] = {}  # {chain: expires_at monotonic seconds}
+        self._cache_duration_s = 300.0  # Cache prices for 5 minutes
+        self._stale_duration_s = 3600.0  # Serve stale prices while refreshing for up to 1 hour
+        self._inflight: Dict[str, asyncio.Future] = {}  # Pending price fetches, shared by concurrent callers
+        self._persist_lock = asyncio.Lock()  # Serialize writes to the cache file
+        self._background_tasks: set = set()  # Keep references to background refresh tasks
+        self._price_cache_path = price_cache_path
+        self._load_cache()
+
+        # Shared price cache across workers/instances (the in-memory cache above acts as L1)
+        # Short timeouts so an unreachable Redis degrades to cache misses instead of hanging requests
+        self.redis = redis.from_url(
+            redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5
+        ) if redis_url else None
 
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP client and Redis connection"""
         await self.client.aclose()
+        if self.redis:
+            await self.redis.aclose()
+
+    @staticmethod
+    def _json(response: httpx.Response):
+        """Parse a JSON response body with orjson"""
+        return orjson.loads(response.content)
+
+    async def _get_conditional(self, url: str) -> Dict:
+        """
+        GET a JSON resource, revalidating the cached copy with
+        If-None-Match / If-Modified-Since and reusing it on 304
+        """
+        cached = self._zone_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with self._stride_sem:
+            response = await self.client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            logger.debug(f"Not modified, using cached response for {url}")
+            return cached[2]
+
+        response.raise_for_status()
+        data = self._json(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._zone_cache[url] = (etag, last_modified, data)
+        return data
 
     async def get_host_zones(self) -> List[Dict]:
         """Query all host zones from Stride"""
         try:
             url = f"{self.api_url}/Stride-Labs/stride/stakeibc/host_zone"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_conditional(url)
             return data.get("host_zone", [])
         except Exception as e:
             logger.error(f"Failed to fetch host zones: {e}")
             raise
 
+    @staticmethod
+    def _index_host_zones(zones: List[Dict]) -> Dict[str, Dict]:
+        """Index a list of host zones by chain ID"""
+        return {zone["chain_id"]: zone for zone in zones if "chain_id" in zone}
+
     async def get_host_zone(self, chain_id: str) -> Optional[Dict]:
         """Query a specific host zone by chain ID"""
         try:
             url = f"{self.api_url}/Stride-Labs/stride/stakeibc/host_zone/{chain_id}"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_conditional(url)
             return data.get("host_zone")
         except Exception as e:
             logger.warning(f"Failed to fetch host zone for {chain_id}: {e}")
@@ -114,96 +208,279 @@ class StrideClient:
         try:
             url = f"{self.api_url}/cosmos/bank/v1beta1/supply/by_denom"
             params = {"denom": denom}
-            response = await self.client.get(url, params=params)
+            async with self._stride_sem:
+                response = await self.client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
             amount = data.get("amount", {}).get("amount", "0")
             return float(amount)
         except Exception as e:
             logger.warning(f"Failed to fetch supply for {denom}: {e}")
             return None
 
-    def _is_price_cached(self, chain: str) -> bool:
-        """Check if price is cached and still valid"""
-        if chain not in self._price_cache:
-            return False
+    def _load_cache(self):
+        """Load persisted prices from disk so they survive restarts"""
+        if not self._price_cache_path or not os.path.exists(self._price_cache_path):
+            return
 
-        cached_data = self._price_cache[chain]
-        age = datetime.now() - cached_data["timestamp"]
-        return age < self._cache_duration
+        try:
+            with open(self._price_cache_path, "rb") as f:
+                data = orjson.loads(f.read())
+            # Expiry is persisted as wall-clock time; convert back to the monotonic clock
+            offset = time.monotonic() - time.time()
+            for chain, entry in data.items():
+                self._price[chain] = entry["price"]
+                self._price_expiry[chain] = entry["expires"] + offset
+            logger.info(f"Loaded {len(self._price)} cached prices from {self._price_cache_path}")
+        except Exception as e:
+            logger.warning(f"Failed to load price cache from {self._price_cache_path}: {e}")
 
-    async def get_token_prices_batch(self, chains: List[str]) -> Dict[str, Optional[float]]:
+    async def _persist_cache(self):
+        """Write the price cache to disk"""
+        if not self._price_cache_path:
+            return
+
+        try:
+            # Monotonic time doesn't survive restarts, so persist expiry as wall-clock time
+            offset = time.time() - time.monotonic()
+            data = {
+                chain: {"price": price, "expires": self._price_expiry[chain] + offset}
+                for chain, price in self._price.items()
+            }
+            # Write to a per-process temp file and atomically swap it in, so other
+            # workers never read a partially written cache file
+            tmp_path = f"{self._price_cache_path}.{os.getpid()}.tmp"
+            async with self._persist_lock:
+                try:
+                    async with aiofiles.open(tmp_path, "wb") as f:
+                        await f.write(orjson.dumps(data))
+                    os.replace(tmp_path, self._price_cache_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+        except Exception as e:
+            logger.warning(f"Failed to persist price cache to {self._price_cache_path}: {e}")
+
+    def _price_cache_status(self, chain: str) -> Tuple[bool, bool]:
         """
-        Fetch multiple token prices in a single request (batch)
-        Uses caching to avoid redundant API calls
+        Check the cache state of a price
+
+        Returns:
+            (fresh, stale) - fresh if within the cache TTL, stale if expired
+            but still within the stale window
         """
-        async with self._price_fetch_lock:
-            # Separate cached and uncached chains
-            prices = {}
-            chains_to_fetch = []
+        expires_at = self._price_expiry.get(chain)
+        if expires_at is None:
+            return False, False
 
+        remaining = expires_at - time.monotonic()
+        if remaining > 0:
+            return True, False
+        return False, remaining > self._cache_duration_s - self._stale_duration_s
+
+    def _is_price_cached(self, chain: str) -> bool:
+        """Check if price is cached and still valid"""
+        return self._price_expiry.get(chain, 0.0) > time.monotonic()
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Backoff delay for a failed attempt, honoring Retry-After on 429s"""
+        backoff = 2 ** attempt  # 1, 2, 4s
+        if response.status_code == 429:
+            try:
+                return float(response.headers.get("Retry-After", backoff))
+            except ValueError:
+                # Retry-After may also be an HTTP date; fall back to backoff
+                return backoff
+        return backoff
+
+    async def _get_with_retry(self, url: str, params: Optional[Dict] = None, attempts: int = 3) -> httpx.Response:
+        """GET with exponential backoff on rate limiting (429) and server errors (5xx)"""
+        for attempt in range(attempts):
+            async with self._price_sem:
+                response = await self.client.get(url, params=params)
+            try:
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError:
+                status = response.status_code
+                retryable = status == 429 or status >= 500
+                if not retryable or attempt == attempts - 1:
+                    raise
+                delay = self._retry_delay(response, attempt)
+                if delay > self.MAX_RETRY_DELAY_S:
+                    logger.warning(f"Request to {url} failed with {status}, Retry-After {delay}s exceeds limit, giving up")
+                    raise
+                logger.warning(f"Request to {url} failed with {status}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+    async def _fetch_prices(self, chains: List[str]) -> Dict[str, Optional[float]]:
+        """Fetch prices from CoinGecko in a single batch request and cache them"""
+        prices = {}
+        try:
+            # Get CoinGecko IDs for chains that need fetching
+            coingecko_ids = []
+            chain_id_map = {}  # Map coingecko_id -> chain
             for chain in chains:
-                if self._is_price_cached(chain):
-                    prices[chain] = self._price_cache[chain]["price"]
-                    logger.debug(f"Using cached price for {chain}: ${prices[chain]}")
-                else:
-                    chains_to_fetch.append(chain)
-
-            # Fetch uncached prices in batch
-            if chains_to_fetch:
-                try:
-                    # Get CoinGecko IDs for chains that need fetching
-                    coingecko_ids = []
-                    chain_id_map = {}  # Map coingecko_id -> chain
-                    for chain in chains_to_fetch:
-                        coingecko_id = self.COINGECKO_IDS.get(chain)
-                        if coingecko_id:
-                            coingecko_ids.append(coingecko_id)
-                            chain_id_map[coingecko_id] = chain
-
-                    if coingecko_ids:
-                        # Batch request for all uncached prices
-                        url = f"{self.price_api_url}/simple/price"
-                        params = {
-                            "ids": ",".join(coingecko_ids),
-                            "vs_currencies": "usd"
-                        }
-                        logger.info(f"Fetching batch prices for: {', '.join(chains_to_fetch)}")
-                        response = await self.client.get(url, params=params)
-                        response.raise_for_status()
-                        data = response.json()
-
-                        # Cache and store results
-                        now = datetime.now()
-                        for coingecko_id, chain in chain_id_map.items():
-                            price = data.get(coingecko_id, {}).get("usd")
-                            if price is not None:
-                                prices[chain] = price
-                                self._price_cache[chain] = {
-                                    "price": price,
-                                    "timestamp": now
-                                }
-                                logger.info(f"Cached price for {chain}: ${price}")
-                            else:
-                                prices[chain] = None
-                                logger.warning(f"No price data for {chain}")
+                coingecko_id = self.COINGECKO_IDS.get(chain)
+                if coingecko_id:
+                    coingecko_ids.append(coingecko_id)
+                    chain_id_map[coingecko_id] = chain
+
+            if coingecko_ids:
+                # Batch request for all uncached prices
+                url = f"{self.price_api_url}/simple/price"
+                params = {
+                    "ids": ",".join(coingecko_ids),
+                    "vs_currencies": "usd"
+                }
+                logger.info(f"Fetching batch prices for: {', '.join(chains)}")
+                response = await self._get_with_retry(url, params=params)
+                data = self._json(response)
+
+                # Cache and store results
+                expires_at = time.monotonic() + self._cache_duration_s
+                for coingecko_id, chain in chain_id_map.items():
+                    price = data.get(coingecko_id, {}).get("usd")
+                    if price is not None:
+                        prices[chain] = price
+                        self._price[chain] = price
+                        self._price_expiry[chain] = expires_at
+                        logger.info(f"Cached price for {chain}: ${price}")
                     else:
-                        logger.warning(f"No CoinGecko IDs found for: {chains_to_fetch}")
+                        prices[chain] = None
+                        logger.warning(f"No price data for {chain}")
 
-                except Exception as e:
-                    logger.error(f"Failed to fetch batch prices: {e}")
-                    # Fill in None for failed chains
-                    for chain in chains_to_fetch:
-                        if chain not in prices:
-                            prices[chain] = None
+                await self._persist_cache()
+                await self._set_shared_prices({c: p for c, p in prices.items() if p is not None})
+            else:
+                logger.warning(f"No CoinGecko IDs found for: {chains}")
 
+        except Exception as e:
+            logger.error(f"Failed to fetch batch prices: {e}")
+            # Fill in None for failed chains
+            for chain in chains:
+                if chain not in prices:
+                    prices[chain] = None
+
+        return prices
+
+    async def _get_shared_prices(self, chains: List[str]) -> Dict[str, float]:
+        """Read prices cached in Redis by any worker and copy them into the local cache"""
+        if not self.redis:
+            return {}
+
+        prices = {}
+        try:
+            values = await self.redis.mget([f"price:{chain}" for chain in chains])
+            offset = time.monotonic() - time.time()
+            for chain, value in zip(chains, values):
+                if value is None:
+                    continue
+                entry = orjson.loads(value)
+                prices[chain] = entry["price"]
+                self._price[chain] = entry["price"]
+                self._price_expiry[chain] = entry["expires"] + offset
+                logger.debug(f"Using Redis cached price for {chain}: ${entry['price']}")
+        except Exception as e:
+            logger.warning(f"Failed to read prices from Redis: {e}")
+
+        return prices
+
+    async def _set_shared_prices(self, prices: Dict[str, float]):
+        """Write freshly fetched prices to Redis with the cache TTL"""
+        if not self.redis or not prices:
+            return
+
+        try:
+            ttl = int(self._cache_duration_s)
+            expires = time.time() + self._cache_duration_s
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for chain, price in prices.items():
+                    pipe.setex(f"price:{chain}", ttl, orjson.dumps({"price": price, "expires": expires}))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to write prices to Redis: {e}")
+
+    def _claim_inflight(self, chains: List[str]) -> Dict[str, asyncio.Future]:
+        """Register an in-flight future per chain so concurrent callers can share the fetch"""
+        loop = asyncio.get_running_loop()
+        futures = {chain: loop.create_future() for chain in chains}
+        self._inflight.update(futures)
+        return futures
+
+    async def _fetch_coalesced(self, futures: Dict[str, asyncio.Future]) -> Dict[str, Optional[float]]:
+        """Fetch prices for claimed chains and resolve their in-flight futures"""
+        try:
+            # Another worker may already have fetched these prices
+            chains = list(futures)
+            prices = await self._get_shared_prices(chains)
+            missing = [chain for chain in chains if chain not in prices]
+            if missing:
+                prices.update(await self._fetch_prices(missing))
+            for chain, future in futures.items():
+                future.set_result(prices.get(chain))
             return prices
+        finally:
+            for chain, future in futures.items():
+                if not future.done():
+                    future.cancel()
+                if self._inflight.get(chain) is future:
+                    del self._inflight[chain]
+
+    async def get_token_prices_batch(self, chains: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Fetch multiple token prices in a single request (batch)
+        Uses caching to avoid redundant API calls; stale prices are returned
+        immediately and refreshed in the background, and chains already being
+        fetched by another caller share that request
+        """
+        # Separate cached, stale, in-flight and uncached chains
+        prices = {}
+        chains_to_fetch = []
+        chains_to_refresh = []
+        pending = {}
+
+        for chain in chains:
+            fresh, stale = self._price_cache_status(chain)
+            if fresh or stale:
+                prices[chain] = self._price[chain]
+                logger.debug(f"Using cached price for {chain}: ${prices[chain]}")
+                if stale and chain not in self._inflight:
+                    chains_to_refresh.append(chain)
+            elif chain in self._inflight:
+                pending[chain] = self._inflight[chain]
+            else:
+                chains_to_fetch.append(chain)
+
+        # Refresh stale prices without blocking the caller
+        if chains_to_refresh:
+            futures = self._claim_inflight(chains_to_refresh)
+            task = asyncio.create_task(self._fetch_coalesced(futures))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        # Fetch uncached prices in batch
+        if chains_to_fetch:
+            futures = self._claim_inflight(chains_to_fetch)
+            prices.update(await self._fetch_coalesced(futures))
+
+        # Wait for fetches started by other callers
+        for chain, future in pending.items():
+            try:
+                prices[chain] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                prices[chain] = None
+
+        return prices
 
     async def get_token_price(self, chain: str) -> Optional[float]:
         """Get USD price for a token using CoinGecko (with caching)"""
         # Check cache first
         if self._is_price_cached(chain):
-            price = self._price_cache[chain]["price"]
+            price = self._price[chain]
             logger.debug(f"Using cached price for {chain}: ${price}")
             return price
 
@@ -214,65 +491,121 @@ class StrideClient:
     async def calculate_daily_fee(self, chain: str) -> Dict[str, float]:
         """
         Calculate daily fees for a specific chain
+        Results are cached briefly; expired results are returned immediately
+        while a background task recomputes them
 
         Returns:
             Dict with dailyFees and dailyRevenue (10% of fees)
         """
+        # Get chain ID
+        chain = chain.lower()
+        chain_id = self.CHAIN_ID_MAP.get(chain)
+        if not chain_id:
+            raise ValueError(f"Unknown chain: {chain}")
+
+        cached = self._fee_cache.get(chain)
+        if cached:
+            expires_at, fees = cached
+            remaining = expires_at - time.monotonic()
+            if remaining > 0:
+                return fees
+            if remaining > self._fee_cache_duration_s - self._fee_stale_duration_s:
+                self._start_fee_task(chain, chain_id)
+                return fees
+
+        # Shield the shared task so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(self._start_fee_task(chain, chain_id))
+
+    def get_cached_fee(self, chain: str) -> Optional[Dict[str, float]]:
+        """Return the cached fees for a chain if they are still fresh"""
+        cached = self._fee_cache.get(chain)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def cache_fee(self, chain: str, fees: Dict[str, float], token_price: Optional[float]):
+        """
+        Cache computed fees for a chain
+        Skipped when the price was unavailable, so a transient price
+        failure doesn't keep serving $0 fees
+        """
+        if not token_price:
+            return
+        self._fee_cache[chain] = (time.monotonic() + self._fee_cache_duration_s, fees)
+
+    def _start_fee_task(self, chain: str, chain_id: str) -> asyncio.Task:
+        """Start (or join) the fee computation for a chain"""
+        task = self._fee_tasks.get(chain)
+        if task is None:
+            task = asyncio.create_task(self._fetch_daily_fee(chain, chain_id))
+            self._fee_tasks[chain] = task
+            task.add_done_callback(lambda t: self._on_fee_task_done(chain, t))
+        return task
+
+    def _on_fee_task_done(self, chain: str, task: asyncio.Task):
+        if self._fee_tasks.get(chain) is task:
+            del self._fee_tasks[chain]
+        if not task.cancelled():
+            task.exception()  # Already logged; mark as retrieved for background refreshes
+
+    async def _fetch_daily_fee(self, chain: str, chain_id: str) -> Dict[str, float]:
+        """Fetch host zone and price for a chain, compute its fees and cache them"""
         try:
-            # Get chain ID
-            chain_id = self.CHAIN_ID_MAP.get(chain.lower())
-            if not chain_id:
-                raise ValueError(f"Unknown chain: {chain}")
-
-            # Get host zone data
-            host_zone = await self.get_host_zone(chain_id)
+            # Host zone (Stride) and price (CoinGecko) are independent, fetch them concurrently
+            host_zone, token_price = await asyncio.gather(
+                self.get_host_zone(chain_id),
+                self.get_token_price(chain)
+            )
             if not host_zone:
                 raise ValueError(f"Host zone not found for {chain_id}")
 
-            # Extract redemption rate and staked amount
-            redemption_rate = float(host_zone.get("redemption_rate", "1.0"))
-            staked_amount_str = host_zone.get("total_delegations", "0")
-            staked_amount = float(staked_amount_str)
-
-            # Get stToken supply (this represents total liquid staked)
-            st_denom = host_zone.get("host_denom", "")
-            if st_denom.startswith("u"):
-                # Convert to st token denom (e.g., uatom -> stuatom)
-                st_denom = f"st{st_denom}"
-
-            # Calculate total value in native tokens
-            # stToken supply * redemption rate = total native tokens
-            total_native_value = staked_amount * redemption_rate
-
-            # Calculate daily rewards (approximate based on typical staking APR)
-            # This is a simplified calculation - in production you'd track historical redemption rates
-            # Typical cosmos chain APR is around 15-20% annually
-            # Daily rate ≈ annual_rate / 365
-            estimated_daily_rate = 0.0005  # ~18% APR / 365
-            daily_rewards_native = total_native_value * estimated_daily_rate
-
-            # Get USD price
-            token_price = await self.get_token_price(chain)
-            if not token_price:
-                logger.warning(f"Could not get price for {chain}, using $0")
-                token_price = 0.0
-
-            # Get the correct decimal places for this chain
-            decimals = self.TOKEN_DECIMALS.get(chain, 6)  # Default to 6 if unknown
-            divisor = 10 ** decimals
-
-            # Calculate fees in USD
-            # Fees are the total rewards earned by stakers
-            daily_fees_usd = daily_rewards_native * token_price / divisor
-
-            # Revenue is 10% of fees (Stride's cut)
-            daily_revenue_usd = daily_fees_usd * 0.10
-
-            return {
-                "dailyFees": daily_fees_usd,
-                "dailyRevenue": daily_revenue_usd
-            }
+            fees = self.compute_fee(chain, host_zone, token_price)
+            self.cache_fee(chain, fees, token_price)
+            return fees
 
         except Exception as e:
             logger.error(f"Failed to calculate fees for {chain}: {e}")
             raise
+
+    def compute_fee(self, chain: str, host_zone: Dict, token_price: Optional[float]) -> Dict[str, float]:
+        """
+        Compute daily fees from host zone data and a USD price (no I/O)
+
+        Returns:
+            Dict with dailyFees and dailyRevenue (10% of fees)
+        """
+        # Extract redemption rate and staked amount
+        redemption_rate = float(host_zone.get("redemption_rate", "1.0"))
+        staked_amount_str = host_zone.get("total_delegations", "0")
+        staked_amount = float(staked_amount_str)
+
+        # Calculate total value in native tokens
+        # stToken supply * redemption rate = total native tokens
+        total_native_value = staked_amount * redemption_rate
+
+        # Calculate daily rewards (approximate based on typical staking APR)
+        # This is a simplified calculation - in production you'd track historical redemption rates
+        # Typical cosmos chain APR is around 15-20% annually
+        # Daily rate ≈ annual_rate / 365
+        estimated_daily_rate = 0.0005  # ~18% APR / 365
+        daily_rewards_native = total_native_value * estimated_daily_rate
+
+        # USD price
+        if not token_price:
+            logger.warning(f"Could not get price for {chain}, using $0")
+            token_price = 0.0
+
+        # Get the divisor for this chain's decimal places
+        divisor = self.TOKEN_DIVISORS.get(chain, 1_000_000)  # Default to 6 decimals if unknown
+
+        # Calculate fees in USD
+        # Fees are the total rewards earned by stakers
+        daily_fees_usd = daily_rewards_native * token_price / divisor
+
+        # Revenue is 10% of fees (Stride's cut)
+        daily_revenue_usd = daily_fees_usd * 0.10
+
+        return {
+            "dailyFees": daily_fees_usd,
+            "dailyRevenue": daily_revenue_usd
+        }